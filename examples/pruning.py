@@ -1,12 +1,18 @@
-import optuna_core
-
+import numba
+import numpy
 
-def f(x):
-    return (x - 2) ** 2
+import optuna_core
 
 
-def df(x):
-    return 2 * x - 4
+@numba.njit(cache=True, fastmath=True)
+def _run_steps(x0, lr, n_steps):
+    # Gradient descent on f(x) = (x - 2) ** 2, recording f(x) at every step.
+    ys = numpy.empty(n_steps)
+    x = x0
+    for step in range(n_steps):
+        ys[step] = (x - 2) ** 2
+        x -= (2 * x - 4) * lr
+    return ys
 
 
 if __name__ == "__main__":
@@ -17,18 +23,15 @@ if __name__ == "__main__":
 
         lr = trial.suggest_loguniform("lr", 1e-5, 1e-1)
 
-        x = 3.0
-        for step in range(128):
-            y = f(x)
-
+        # The numerical work is compiled and runs in one call. Optuna only sees the
+        # per-step values for reporting and pruning.
+        ys = _run_steps(3.0, lr, 128)
+        for step, y in enumerate(ys):
             trial.report(y, step=step)
             if trial.should_prune():
                 print(f"Pruned trial {trial.number} at step {step}: {y}. ", end="")
                 study.tell(trial, state=optuna_core.trial.TrialState.PRUNED, value=y)
                 break
-
-            gy = df(x)
-            x -= gy * lr
         else:
             print(f"Completed trial {trial.number}: {y}. ", end="")
             study.tell(trial, state=optuna_core.trial.TrialState.COMPLETE, value=y)
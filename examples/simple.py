@@ -4,12 +4,16 @@ import optuna_core
 if __name__ == "__main__":
     study = optuna_core.study.create_study(direction="minimize")
 
-    for _ in range(100):
-        trial = study.ask()
+    for _ in range(10):
+        trials = study.ask_batch(10)
 
-        x = trial.suggest_float("x", -5.0, 5.0)
-        y = (x - 2) ** 2
+        values = []
+        for trial in trials:
+            x = trial.suggest_float("x", -5.0, 5.0)
+            values.append((x - 2) ** 2)
 
-        study.tell(trial, state=optuna_core.trial.TrialState.COMPLETE, value=y)
+        states = [optuna_core.trial.TrialState.COMPLETE] * len(trials)
+        study.tell_batch(trials, states, values)
 
-        print(f"Completed trial {trial.number}: {y}. Best: {study.best_trial.value}.")
+        for trial, y in zip(trials, values):
+            print(f"Completed trial {trial.number}: {y}. Best: {study.best_trial.value}.")
@@ -1,19 +1,34 @@
+import importlib
+from typing import Any
+
 import optuna_core
-from optuna_core.pruners._base import BasePruner  # NOQA
-from optuna_core.pruners._hyperband import HyperbandPruner  # NOQA
-from optuna_core.pruners._median import MedianPruner  # NOQA
-from optuna_core.pruners._nop import NopPruner  # NOQA
-from optuna_core.pruners._percentile import PercentilePruner  # NOQA
-from optuna_core.pruners._successive_halving import SuccessiveHalvingPruner  # NOQA
-from optuna_core.pruners._threshold import ThresholdPruner  # NOQA
+
+
+# Submodules are imported lazily via PEP 562 so that importing `optuna_core` does not
+# pay for pruners that are never used. Each name is resolved and cached in the module
+# globals on first attribute access.
+_LAZY_IMPORTS = {
+    "BasePruner": "optuna_core.pruners._base",
+    "HyperbandPruner": "optuna_core.pruners._hyperband",
+    "MedianPruner": "optuna_core.pruners._median",
+    "NopPruner": "optuna_core.pruners._nop",
+    "PercentilePruner": "optuna_core.pruners._percentile",
+    "SuccessiveHalvingPruner": "optuna_core.pruners._successive_halving",
+    "ThresholdPruner": "optuna_core.pruners._threshold",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
 
 
 def _filter_study(
     study: "optuna_core.study.Study", trial: "optuna_core.trial.FrozenTrial"
 ) -> "optuna_core.study.Study":
-    if isinstance(study.pruner, HyperbandPruner):
-        # Create `_BracketStudy` to use trials that have the same bracket id.
-        pruner = study.pruner  # type: HyperbandPruner
-        return pruner._create_bracket_study(study, pruner._get_bracket_id(study, trial))
-    else:
-        return study
+    # The Hyperband branch is resolved once per study; see `Study._pruner_filter`.
+    return study._pruner_filter(trial)
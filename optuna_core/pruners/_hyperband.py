@@ -247,7 +247,7 @@ class HyperbandPruner(BasePruner):
         # `SuccessiveHalvingPruner.prune` in which `get_trials`,
         # `direction`, and `storage` are used.
         # But for safety, prohibit the other attributes explicitly.
-        class _BracketStudy(core.study.Study):
+        class _BracketStudy(optuna_core.study.Study):
 
             _VALID_ATTRS = (
                 "get_trials",
@@ -259,6 +259,17 @@ class HyperbandPruner(BasePruner):
                 "_bracket_id",
                 "sampler",
                 "trials",
+                # Internals reached through the attributes allowed above.
+                "_init_study",
+                "_pruner_filter",
+                "_identity_pruner_filter",
+                "_hyperband_pruner_filter",
+                "_maybe_sync",
+                "_storage_is_in_memory",
+                "_synced_trial_id",
+                "_finished_trials_cache",
+                "_get_snapshot",
+                "_snapshot_cache",
             )
 
             def __init__(self, study: "optuna_core.study.Study", bracket_id: int) -> None:
@@ -1,5 +1,23 @@
-from optuna_core.samplers._base import BaseSampler  # NOQA
-from optuna_core.samplers._grid import GridSampler  # NOQA
-from optuna_core.samplers._random import RandomSampler  # NOQA
-from optuna_core.samplers._search_space import intersection_search_space  # NOQA
-from optuna_core.samplers._search_space import IntersectionSearchSpace  # NOQA
+import importlib
+from typing import Any
+
+
+# Submodules are imported lazily via PEP 562 so that importing `optuna_core` does not
+# pay for samplers that are never used. Each name is resolved and cached in the module
+# globals on first attribute access.
+_LAZY_IMPORTS = {
+    "BaseSampler": "optuna_core.samplers._base",
+    "GridSampler": "optuna_core.samplers._grid",
+    "RandomSampler": "optuna_core.samplers._random",
+    "intersection_search_space": "optuna_core.samplers._search_space",
+    "IntersectionSearchSpace": "optuna_core.samplers._search_space",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -1,6 +1,8 @@
 import abc
 from typing import Any
+from typing import Callable
 from typing import Dict
+from typing import Optional
 
 import optuna_core
 from optuna_core.distributions import BaseDistribution
@@ -140,6 +142,26 @@ class BaseSampler(object, metaclass=abc.ABCMeta):
 
         raise NotImplementedError
 
+    def _compile_independent(
+        self, param_distribution: BaseDistribution
+    ) -> Optional[Callable[[], Any]]:
+        """Return a specialized zero-argument version of ``sample_independent``, if possible.
+
+        Samplers whose independent sampling does not depend on the study or trial state
+        can return a callable with the distribution parameters pre-resolved, letting
+        callers bypass the generic dispatch on repeated suggestions of the same
+        parameter. Returning :obj:`None` (the default) disables the fast path.
+
+        Args:
+            param_distribution:
+                Distribution object to specialize for.
+
+        Returns:
+            A zero-argument callable drawing one parameter value, or :obj:`None`.
+        """
+
+        return None
+
     def reseed_rng(self) -> None:
         """Reseed sampler's random number generator.
 
@@ -1,4 +1,5 @@
 from typing import Any
+from typing import Callable
 from typing import Dict
 from typing import Optional
 
@@ -103,3 +104,24 @@ class RandomSampler(BaseSampler):
             return choices[index]
         else:
             raise NotImplementedError
+
+    def _compile_independent(
+        self, param_distribution: distributions.BaseDistribution
+    ) -> Optional[Callable[[], Any]]:
+
+        if type(self) is not RandomSampler:
+            # A subclass may have overridden `sample_independent`.
+            return None
+
+        # The closures draw from `self._rng` through the sampler, so they stay valid
+        # across `reseed_rng` and produce the same stream as `sample_independent`.
+        if isinstance(param_distribution, distributions.UniformDistribution):
+            low = param_distribution.low
+            high = param_distribution.high
+            return lambda: self._rng.uniform(low, high)
+        elif isinstance(param_distribution, distributions.LogUniformDistribution):
+            log_low = numpy.log(param_distribution.low)
+            log_high = numpy.log(param_distribution.high)
+            return lambda: float(numpy.exp(self._rng.uniform(log_low, log_high)))
+        else:
+            return None
@@ -1,13 +1,58 @@
+import importlib
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import TYPE_CHECKING
 from typing import Union
 
-from optuna_core.storages._base import BaseStorage
-from optuna_core.storages._in_memory import InMemoryStorage
+if TYPE_CHECKING:
+    from optuna_core.storages._base import BaseStorage
 
 
-def get_storage(storage: Union[None, str, BaseStorage]) -> BaseStorage:
+# Submodules are imported lazily via PEP 562 so that importing `optuna_core` does not
+# pull in the storage backends before one is actually used. Each name is resolved and
+# cached in the module globals on first attribute access.
+_LAZY_IMPORTS = {
+    "BaseStorage": "optuna_core.storages._base",
+    "StudySnapshot": "optuna_core.storages._base",
+    "InMemoryStorage": "optuna_core.storages._in_memory",
+}
 
-    if storage is None:
-        return InMemoryStorage()
-    if isinstance(storage, str):
-        raise NotImplementedError
-    return storage
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def _make_in_memory(storage: None) -> "BaseStorage":
+    from optuna_core.storages._in_memory import InMemoryStorage
+
+    return InMemoryStorage()
+
+
+def _raise_not_implemented(storage: str) -> "BaseStorage":
+    raise NotImplementedError
+
+
+# `get_storage` runs in every public entry point, so the argument type is resolved
+# with one hash lookup instead of an isinstance chain. Anything not in the table is
+# assumed to already be a storage instance and passed through.
+_STORAGE_DISPATCH = {
+    type(None): _make_in_memory,
+    str: _raise_not_implemented,
+}  # type: Dict[type, Callable]
+
+
+def get_storage(storage: Union[None, str, "BaseStorage"]) -> "BaseStorage":
+
+    fn = _STORAGE_DISPATCH.get(type(storage))
+    if fn is None:
+        from optuna_core.storages._base import BaseStorage
+
+        assert isinstance(storage, BaseStorage)
+        return storage
+    return fn(storage)
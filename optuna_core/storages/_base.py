@@ -1,4 +1,5 @@
 import abc
+import dataclasses
 from typing import Any
 from typing import Dict
 from typing import List
@@ -14,6 +15,33 @@ from optuna_core.trial import TrialState
 DEFAULT_STUDY_NAME_PREFIX = "no-name-"
 
 
+@dataclasses.dataclass
+class StudySnapshot:
+    """Frequently read attributes of a study, fetched from a storage in one call.
+
+    This class is not supposed to be directly accessed by library users.
+
+    Attributes:
+        direction:
+            :class:`~optuna.study.StudyDirection` of the study.
+        best_trial:
+            :class:`~optuna.trial.FrozenTrial` with the best objective value, or :obj:`None`
+            if no trial has been completed.
+        user_attrs:
+            Dictionary with the user attributes of the study.
+        system_attrs:
+            Dictionary with the optuna-internal attributes of the study.
+        n_trials:
+            Number of trials in the study.
+    """
+
+    direction: "optuna_core.study.StudyDirection"
+    best_trial: Optional[FrozenTrial]
+    user_attrs: Dict[str, Any]
+    system_attrs: Dict[str, Any]
+    n_trials: int
+
+
 class BaseStorage(object, metaclass=abc.ABCMeta):
     """Base class for storages.
 
@@ -321,6 +349,33 @@ class BaseStorage(object, metaclass=abc.ABCMeta):
         """
         raise NotImplementedError
 
+    def create_new_trials(
+        self, study_id: int, n: int, template_trial: Optional[FrozenTrial] = None
+    ) -> List[int]:
+        """Create and add ``n`` new trials to a study in one call.
+
+        Storages that can batch the inserts into a single round-trip should override
+        this method. The default implementation falls back to ``n`` individual
+        :func:`~optuna.storages.BaseStorage.create_new_trial` calls.
+
+        Args:
+            study_id:
+                ID of the study.
+            n:
+                Number of trials to create.
+            template_trial:
+                Template :class:`~optuna.trial.FronzenTrial` applied to every created
+                trial.
+
+        Returns:
+            IDs of the created trials, in creation order.
+
+        Raises:
+            :exc:`KeyError`:
+                If no study with the matching ``study_id`` exists.
+        """
+        return [self.create_new_trial(study_id, template_trial=template_trial) for _ in range(n)]
+
     @abc.abstractmethod
     def set_trial_state(self, trial_id: int, state: TrialState) -> bool:
         """Update the state of a trial.
@@ -592,6 +647,36 @@ class BaseStorage(object, metaclass=abc.ABCMeta):
 
         return best_trial
 
+    def get_study_snapshot(self, study_id: int) -> StudySnapshot:
+        """Read frequently accessed attributes of a study in a single batched call.
+
+        Storages that can coalesce these reads into one round-trip should override this
+        method. The default implementation falls back to the individual getters.
+
+        Args:
+            study_id:
+                ID of the study.
+
+        Returns:
+            A :class:`~optuna.storages.StudySnapshot` of the study.
+
+        Raises:
+            :exc:`KeyError`:
+                If no study with the matching ``study_id`` exists.
+        """
+        try:
+            best_trial = self.get_best_trial(study_id)  # type: Optional[FrozenTrial]
+        except ValueError:
+            best_trial = None
+
+        return StudySnapshot(
+            direction=self.get_study_direction(study_id),
+            best_trial=best_trial,
+            user_attrs=self.get_study_user_attrs(study_id),
+            system_attrs=self.get_study_system_attrs(study_id),
+            n_trials=self.get_n_trials(study_id),
+        )
+
     def get_trial_params(self, trial_id: int) -> Dict[str, Any]:
         """Read the parameter dictionary of a trial.
 
@@ -641,6 +726,32 @@ class BaseStorage(object, metaclass=abc.ABCMeta):
         """
         return self.get_trial(trial_id).system_attrs
 
+    def prefetch_trials(self, study_id: int, since_number: int) -> List[FrozenTrial]:
+        """Read all trials whose number is greater than ``since_number``.
+
+        Finished trials are immutable, so callers that cache them only need the tail
+        of the trial table on subsequent reads. Remote storages should override this
+        method to fetch that tail in one batched round-trip; the default
+        implementation filters a full read.
+
+        Args:
+            study_id:
+                ID of the study.
+            since_number:
+                Number of the last trial already known to the caller, or ``-1`` to
+                read all trials.
+
+        Returns:
+            List of trials with numbers greater than ``since_number``, ordered by
+            trial number.
+
+        Raises:
+            :exc:`KeyError`:
+                If no study with the matching ``study_id`` exists.
+        """
+        trials = self.get_all_trials(study_id, deepcopy=False)
+        return [t for t in trials if t.number > since_number]
+
     def read_trials_from_remote_storage(self, study_id: int) -> None:
         """Make an internal cache of trials up-to-date.
 
@@ -8,11 +8,14 @@ from typing import Optional
 from typing import Tuple
 import uuid
 
+import numpy
+
 import optuna_core
 from optuna_core import distributions
 from optuna_core.exceptions import DuplicatedStudyError
 from optuna_core.storages._base import BaseStorage
 from optuna_core.storages._base import DEFAULT_STUDY_NAME_PREFIX
+from optuna_core.storages._base import StudySnapshot
 from optuna_core.study._study_summary import StudySummary
 from optuna_core.trial import FrozenTrial
 from optuna_core.trial import TrialState
@@ -143,6 +146,23 @@ class InMemoryStorage(BaseStorage):
             self._check_study_id(study_id)
             return self._studies[study_id].system_attrs
 
+    def get_study_snapshot(self, study_id: int) -> StudySnapshot:
+
+        with self._lock:
+            self._check_study_id(study_id)
+
+            study = self._studies[study_id]
+            best_trial = None
+            if study.best_trial_id is not None:
+                best_trial = self._get_trial(study.best_trial_id)
+            return StudySnapshot(
+                direction=study.direction,
+                best_trial=best_trial,
+                user_attrs=study.user_attrs,
+                system_attrs=study.system_attrs,
+                n_trials=len(study.trials),
+            )
+
     def get_all_study_summaries(self) -> List[StudySummary]:
 
         with self._lock:
@@ -164,7 +184,7 @@ class InMemoryStorage(BaseStorage):
             )
             if study.trials
             else None,
-            study_id=study_id,
+            _study_id=study_id,
         )
 
     def create_new_trial(self, study_id: int, template_trial: Optional[FrozenTrial] = None) -> int:
@@ -182,10 +202,21 @@ class InMemoryStorage(BaseStorage):
             trial.number = len(self._studies[study_id].trials)
             trial._trial_id = trial_id
             self._trial_id_to_study_id_and_number[trial_id] = (study_id, trial.number)
-            self._studies[study_id].trials.append(trial)
+            self._studies[study_id].append_trial(trial)
             self._update_cache(trial_id, study_id)
             return trial_id
 
+    def create_new_trials(
+        self, study_id: int, n: int, template_trial: Optional[FrozenTrial] = None
+    ) -> List[int]:
+
+        # The lock is re-entrant, so the per-trial calls below run under this single
+        # acquisition instead of locking once per trial.
+        with self._lock:
+            return [
+                self.create_new_trial(study_id, template_trial=template_trial) for _ in range(n)
+            ]
+
     @staticmethod
     def _create_running_trial() -> FrozenTrial:
 
@@ -212,7 +243,7 @@ class InMemoryStorage(BaseStorage):
             trial = copy.copy(trial)
             self.check_trial_is_updatable(trial_id, trial.state)
 
-            if state == TrialState.RUNNING and trial.state != TrialState.WAITING:
+            if state == _RUNNING and trial.state != _WAITING:
                 return False
 
             trial.state = state
@@ -269,11 +300,42 @@ class InMemoryStorage(BaseStorage):
         with self._lock:
             self._check_study_id(study_id)
 
-            best_trial_id = self._studies[study_id].best_trial_id
+            study = self._studies[study_id]
+            best_trial_id = study.best_trial_id
+            if best_trial_id is None:
+                best_trial_id = self._find_best_trial_id(study_id)
+                if best_trial_id is not None:
+                    # Repopulate the incremental cache so subsequent calls are O(1).
+                    study.best_trial_id = best_trial_id
+                    study.best_value = self._get_trial(best_trial_id).value
             if best_trial_id is None:
                 raise ValueError("No trials are completed yet.")
             return self.get_trial(best_trial_id)
 
+    def _find_best_trial_id(self, study_id: int) -> Optional[int]:
+        """Locate the best completed trial with one reduction over the value array.
+
+        Thanks to the structure-of-arrays layout of `_StudyInfo`, this is a single
+        vectorized scan over contiguous float64/uint8 arrays rather than a Python-level
+        loop over one `FrozenTrial` object per trial.
+        """
+
+        study = self._studies[study_id]
+        n = len(study.trials)
+        if n == 0:
+            return None
+
+        complete = study.states[:n] == _COMPLETE
+        if not complete.any():
+            return None
+
+        values = study.values[:n]
+        if study.direction == optuna_core.study.StudyDirection.MAXIMIZE:
+            number = int(numpy.argmax(numpy.where(complete, values, -numpy.inf)))
+        else:
+            number = int(numpy.argmin(numpy.where(complete, values, numpy.inf)))
+        return study.trials[number]._trial_id
+
     def get_trial_param(self, trial_id: int, param_name: str) -> float:
 
         with self._lock:
@@ -298,29 +360,28 @@ class InMemoryStorage(BaseStorage):
 
         trial = self._get_trial(trial_id)
 
-        if trial.state != TrialState.COMPLETE:
+        if trial.state != _COMPLETE:
             return
 
-        best_trial_id = self._studies[study_id].best_trial_id
-        if best_trial_id is None:
-            self._studies[study_id].best_trial_id = trial_id
-            return
-        best_trial = self._get_trial(best_trial_id)
-        assert best_trial is not None
-        best_value = best_trial.value
+        study = self._studies[study_id]
         new_value = trial.value
-        if best_value is None:
-            self._studies[study_id].best_trial_id = trial_id
+        if study.best_trial_id is None or study.best_value is None:
+            study.best_trial_id = trial_id
+            study.best_value = new_value
             return
         # Complete trials do not have `None` values.
         assert new_value is not None
 
-        if self.get_study_direction(study_id) == optuna_core.study.StudyDirection.MAXIMIZE:
-            if best_value < new_value:
-                self._studies[study_id].best_trial_id = trial_id
+        # The best value is cached alongside the best trial ID, so keeping the cache
+        # up-to-date is a single float comparison without any trial lookup.
+        if study.direction == optuna_core.study.StudyDirection.MAXIMIZE:
+            if study.best_value < new_value:
+                study.best_trial_id = trial_id
+                study.best_value = new_value
         else:
-            if best_value > new_value:
-                self._studies[study_id].best_trial_id = trial_id
+            if study.best_value > new_value:
+                study.best_trial_id = trial_id
+                study.best_value = new_value
 
     def set_trial_intermediate_value(
         self, trial_id: int, step: int, intermediate_value: float
@@ -375,7 +436,7 @@ class InMemoryStorage(BaseStorage):
 
     def _set_trial(self, trial_id: int, trial: FrozenTrial) -> None:
         study_id, trial_number = self._trial_id_to_study_id_and_number[trial_id]
-        self._studies[study_id].trials[trial_number] = trial
+        self._studies[study_id].set_trial(trial_number, trial)
 
     def get_all_trials(self, study_id: int, deepcopy: bool = True) -> List[FrozenTrial]:
 
@@ -384,18 +445,19 @@ class InMemoryStorage(BaseStorage):
             if deepcopy:
                 return copy.deepcopy(self._studies[study_id].trials)
             else:
-                return self._studies[study_id].trials[:]
+                # Return a view over the internal list. Callers must not mutate it; see
+                # the thread-safety notes in `BaseStorage`.
+                return self._studies[study_id].trials
 
     def get_n_trials(self, study_id: int, state: Optional[TrialState] = None) -> int:
 
         with self._lock:
             self._check_study_id(study_id)
+            study = self._studies[study_id]
             if state is None:
-                return len(self._studies[study_id].trials)
+                return len(study.trials)
 
-            return sum(
-                trial.state == state for trial in self.get_all_trials(study_id, deepcopy=False)
-            )
+            return int((study.states[: len(study.trials)] == state.value).sum())
 
     def read_trials_from_remote_storage(self, study_id: int) -> None:
         self._check_study_id(study_id)
@@ -411,12 +473,42 @@ class InMemoryStorage(BaseStorage):
             raise KeyError("No trial with trial_id {} exists.".format(trial_id))
 
 
+_INITIAL_TRIAL_CAPACITY = 16
+
+# Pre-resolved state values; `TrialState` is an `IntEnum`, so comparisons against
+# these plain ints on the trial write paths are C-level equality checks.
+_RUNNING = TrialState.RUNNING.value
+_COMPLETE = TrialState.COMPLETE.value
+_WAITING = TrialState.WAITING.value
+
+
 class _StudyInfo:
     def __init__(self, name: str) -> None:
         self.trials = []  # type: List[FrozenTrial]
+        # Structure-of-arrays mirror of the per-trial objective values and states.
+        # Contiguous arrays turn scans over all trials into a single vectorized
+        # reduction instead of one Python object traversal per trial. Only the first
+        # `len(self.trials)` entries are valid; the arrays grow by doubling.
+        self.values = numpy.empty(_INITIAL_TRIAL_CAPACITY, dtype=numpy.float64)
+        self.states = numpy.empty(_INITIAL_TRIAL_CAPACITY, dtype=numpy.uint8)
         self.param_distribution = {}  # type: Dict[str, distributions.BaseDistribution]
         self.user_attrs = {}  # type: Dict[str, Any]
         self.system_attrs = {}  # type: Dict[str, Any]
         self.name = name  # type: str
         self.direction = optuna_core.study.StudyDirection.NOT_SET
         self.best_trial_id = None  # type: Optional[int]
+        self.best_value = None  # type: Optional[float]
+
+    def append_trial(self, trial: FrozenTrial) -> None:
+        number = len(self.trials)
+        if number == len(self.values):
+            self.values = numpy.resize(self.values, 2 * number)
+            self.states = numpy.resize(self.states, 2 * number)
+        self.values[number] = trial.value if trial.value is not None else numpy.nan
+        self.states[number] = trial.state.value
+        self.trials.append(trial)
+
+    def set_trial(self, number: int, trial: FrozenTrial) -> None:
+        self.values[number] = trial.value if trial.value is not None else numpy.nan
+        self.states[number] = trial.state.value
+        self.trials[number] = trial
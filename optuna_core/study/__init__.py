@@ -1,5 +1,6 @@
 from optuna_core.study._study import create_study  # NOQA
 from optuna_core.study._study import delete_study  # NOQA
 from optuna_core.study._study import load_study  # NOQA
+from optuna_core.study._study import Study  # NOQA
 from optuna_core.study._study_direction import StudyDirection  # NOQA
 from optuna_core.study._study_summary import StudySummary  # NOQA
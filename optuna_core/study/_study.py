@@ -1,13 +1,14 @@
 import copy
-import threading
 from typing import Any
 from typing import Callable
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Union
 
 import optuna_core
+from optuna_core import distributions
 from optuna_core import exceptions
 from optuna_core import pruners
 from optuna_core import samplers
@@ -22,6 +23,14 @@ from optuna_core.trial import TrialState
 
 ObjectiveFuncType = Callable[[trial_module.Trial], float]
 
+# Upper bound on the number of finished `Trial` objects a study keeps around for
+# recycling in `ask`. Small, since only trials in flight at the same time benefit.
+_TRIAL_POOL_MAX_SIZE = 4
+
+# Pre-resolved state value; `TrialState` is an `IntEnum`, so comparing against the
+# plain int in `tell` is a C-level equality check.
+_COMPLETE = TrialState.COMPLETE.value
+
 
 class Study(object):
     """A study corresponds to an optimization task, i.e., a set of trials.
@@ -35,6 +44,25 @@ class Study(object):
 
     """
 
+    # Fixing the attribute layout removes the per-instance `__dict__` and speeds up
+    # attribute access on the hot ask/tell/suggest paths.
+    __slots__ = (
+        "study_name",
+        "_study_id",
+        "_storage",
+        "_storage_is_in_memory",
+        "_synced_trial_id",
+        "_snapshot_cache",
+        "_finished_trials_cache",
+        "sampler",
+        "pruner",
+        "_compiled_suggestors",
+        "_trial_pool",
+        "_pruner_filter",
+        "_inside_optimize",
+        "_stop_flag",
+    )
+
     def __init__(
         self,
         study_name: str,
@@ -42,42 +70,226 @@ class Study(object):
         sampler: Optional["samplers.BaseSampler"] = None,
         pruner: Optional[pruners.BasePruner] = None,
     ) -> None:
-        self.study_name = study_name
         storage = storages.get_storage(storage)
         study_id = storage.get_study_id_from_name(study_name)
+        self._init_study(study_name, storage, study_id, sampler, pruner)
+
+    @classmethod
+    def _from_id(
+        cls,
+        storage: "storages.BaseStorage",
+        study_id: int,
+        study_name: str,
+        sampler: Optional["samplers.BaseSampler"] = None,
+        pruner: Optional[pruners.BasePruner] = None,
+    ) -> "Study":
+        """Construct a study from an already resolved storage and study ID.
+
+        Skips the name-to-ID lookup of the public constructor, which is a storage
+        round-trip callers such as :func:`~optuna.study.create_study` have already
+        paid for.
+        """
+
+        study = cls.__new__(cls)
+        study._init_study(study_name, storage, study_id, sampler, pruner)
+        return study
+
+    def _init_study(
+        self,
+        study_name: str,
+        storage: "storages.BaseStorage",
+        study_id: int,
+        sampler: Optional["samplers.BaseSampler"],
+        pruner: Optional[pruners.BasePruner],
+    ) -> None:
+        self.study_name = study_name
 
         self._study_id = study_id
         self._storage = storage
 
+        # Syncing with a remote storage is a no-op for in-memory storages, so the call is
+        # short-circuited altogether on that path.
+        self._storage_is_in_memory = isinstance(storage, storages.InMemoryStorage)
+        # ID of the trial for which the remote storage has already been synced, or
+        # :obj:`None` if no trial is in flight. Used to coalesce redundant syncs within
+        # the lifetime of a single trial.
+        self._synced_trial_id = None  # type: Optional[int]
+
+        # Lazily populated study snapshot, invalidated whenever the study is modified.
+        # Coalesces the storage reads behind `direction`, `best_trial` and the attribute
+        # getters into a single batched call.
+        self._snapshot_cache = None  # type: Optional[storages.StudySnapshot]
+
+        # Leading run of finished trials fetched from a remote storage so far. Finished
+        # trials are immutable, so `get_trials` only prefetches the tail of the trial
+        # table beyond this prefix. Unused for in-memory storages.
+        self._finished_trials_cache = []  # type: List[FrozenTrial]
+
         self.sampler = sampler or samplers.RandomSampler()
         self.pruner = pruner or pruners.MedianPruner()
 
-        self._optimize_lock = threading.Lock()
+        # Per-parameter suggestors specialized by the sampler, keyed by parameter name.
+        # Populated lazily on first suggestion; the compiling sampler and distribution
+        # are stored alongside to detect replaced samplers and search spaces that
+        # change between trials.
+        self._compiled_suggestors = (
+            {}
+        )  # type: Dict[str, Tuple[samplers.BaseSampler, distributions.BaseDistribution, Callable[[], Any]]]  # NOQA: E501
+
+        # Freelist of finished `Trial` objects recycled by `ask` to avoid re-allocating
+        # one per trial in tight ask/tell loops.
+        self._trial_pool = []  # type: List[trial_module.Trial]
+
+        # The pruner is fixed for the study's lifetime, so the Hyperband branch of
+        # `pruners._filter_study` is resolved once here instead of on every prune check.
+        # The common non-Hyperband case binds a method that simply returns the study.
+        self._pruner_filter = (
+            self._hyperband_pruner_filter
+            if isinstance(self.pruner, pruners.HyperbandPruner)
+            else self._identity_pruner_filter
+        )
+
+        # Plain boolean set/cleared by the optimization loop. `stop` only needs to know
+        # whether it is being called from inside that loop, so no mutex is required.
+        self._inside_optimize = False
         self._stop_flag = False
 
-    def __getstate__(self) -> Dict[Any, Any]:
+    def __getstate__(self) -> Dict[str, Any]:
 
-        state = self.__dict__.copy()
-        del state["_optimize_lock"]
-        return state
+        # Compiled suggestors are closures over the sampler's RNG and cannot be
+        # pickled, and the trial pool is a pure allocation cache. Both are rebuilt
+        # lazily after unpickling.
+        return {
+            slot: getattr(self, slot)
+            for slot in Study.__slots__
+            if slot not in ("_compiled_suggestors", "_trial_pool")
+        }
 
-    def __setstate__(self, state: Dict[Any, Any]) -> None:
+    def __setstate__(self, state: Dict[str, Any]) -> None:
 
-        self.__dict__.update(state)
-        self._optimize_lock = threading.Lock()
+        for slot, value in state.items():
+            setattr(self, slot, value)
+        self._compiled_suggestors = {}
+        self._trial_pool = []
+
+    def _identity_pruner_filter(self, trial: FrozenTrial) -> "Study":
+        return self
+
+    def _hyperband_pruner_filter(self, trial: FrozenTrial) -> "Study":
+        # Only bound as `_pruner_filter` when the pruner is a `HyperbandPruner`.
+        pruner = self.pruner
+        return pruner._create_bracket_study(self, pruner._get_bracket_id(self, trial))
+
+    def _maybe_sync(self) -> None:
+        """Sync trials with the remote storage unless the sync is known to be redundant.
+
+        The call is skipped for in-memory storages, which have no remote state, and when the
+        storage has already been synced during the lifetime of the currently running trial.
+        """
+
+        if self._storage_is_in_memory:
+            return
+
+        if self._synced_trial_id is not None:
+            return
 
-    def ask(self) -> trial_module.Trial:
         self._storage.read_trials_from_remote_storage(self._study_id)
 
+    def _compiled_suggestor(
+        self, name: str, distribution: distributions.BaseDistribution
+    ) -> Optional[Callable[[], Any]]:
+        entry = self._compiled_suggestors.get(name)
+        if entry is not None and entry[0] is self.sampler and entry[1] == distribution:
+            return entry[2]
+
+        suggestor = self.sampler._compile_independent(distribution)
+        if suggestor is not None:
+            self._compiled_suggestors[name] = (self.sampler, distribution, suggestor)
+        return suggestor
+
+    def _get_snapshot(self) -> "storages.StudySnapshot":
+        if self._snapshot_cache is None:
+            self._snapshot_cache = self._storage.get_study_snapshot(self._study_id)
+        return self._snapshot_cache
+
+    def ask(self) -> trial_module.Trial:
+        # A new trial starts a new lifetime, so any previously coalesced sync is stale.
+        self._synced_trial_id = None
+        self._maybe_sync()
+
         trial_id = self._storage.create_new_trial(self._study_id)
+        self._synced_trial_id = trial_id
+        self._snapshot_cache = None
+        return self._new_trial(trial_id)
+
+    def _new_trial(self, trial_id: int) -> trial_module.Trial:
+        if self._trial_pool:
+            trial = self._trial_pool.pop()
+            trial._reset(self, trial_id)
+            return trial
         return trial_module.Trial(self, trial_id)
 
+    def ask_batch(self, n: int) -> List[trial_module.Trial]:
+        """Create ``n`` new trials with a single storage round-trip.
+
+        This is the batched form of :func:`~optuna.study.Study.ask` for
+        embarrassingly-parallel search spaces: the trials are created in one
+        storage call and can be evaluated independently before being finished
+        with :func:`~optuna.study.Study.tell_batch`.
+
+        Args:
+            n:
+                Number of trials to create.
+
+        Returns:
+            A list of :class:`~optuna.trial.Trial` objects.
+        """
+
+        # A new batch starts new trial lifetimes, so any previously coalesced sync is
+        # stale.
+        self._synced_trial_id = None
+        self._maybe_sync()
+
+        trial_ids = self._storage.create_new_trials(self._study_id, n)
+        self._synced_trial_id = trial_ids[-1] if trial_ids else None
+        self._snapshot_cache = None
+        return [self._new_trial(trial_id) for trial_id in trial_ids]
+
     def tell(self, trial: trial_module.Trial, state: TrialState, value: Optional[float]) -> None:
-        if state == TrialState.COMPLETE:
+        if state == _COMPLETE:
             assert value is not None
         if value is not None:
             self._storage.set_trial_value(trial._trial_id, value)
         self._storage.set_trial_state(trial._trial_id, state)
+        self._synced_trial_id = None
+        self._snapshot_cache = None
+
+        # The trial object may be recycled by a future `ask`, so callers must not keep
+        # using it after telling.
+        if type(trial) is trial_module.Trial and len(self._trial_pool) < _TRIAL_POOL_MAX_SIZE:
+            self._trial_pool.append(trial)
+
+    def tell_batch(
+        self,
+        trials: List[trial_module.Trial],
+        states: List[TrialState],
+        values: List[Optional[float]],
+    ) -> None:
+        """Finish a batch of trials created with :func:`~optuna.study.Study.ask_batch`.
+
+        Args:
+            trials:
+                Trials to finish.
+            states:
+                Resulting state of each trial.
+            values:
+                Objective value of each trial, or :obj:`None` for trials without one.
+        """
+
+        assert len(trials) == len(states) == len(values)
+
+        for trial, state, value in zip(trials, states, values):
+            self.tell(trial, state, value)
 
     @property
     def best_params(self) -> Dict[str, Any]:
@@ -104,7 +316,10 @@ class Study(object):
             A :class:`~optuna.FrozenTrial` object of the best trial.
         """
 
-        return copy.deepcopy(self._storage.get_best_trial(self._study_id))
+        best_trial = self._get_snapshot().best_trial
+        if best_trial is None:
+            raise ValueError("No trials are completed yet.")
+        return best_trial._fast_clone()
 
     @property
     def direction(self) -> "optuna_core.study.StudyDirection":
@@ -114,7 +329,7 @@ class Study(object):
             A :class:`~optuna.study.StudyDirection` object.
         """
 
-        return self._storage.get_study_direction(self._study_id)
+        return self._get_snapshot().direction
 
     @property
     def trials(self) -> List[FrozenTrial]:
@@ -165,8 +380,35 @@ class Study(object):
             A list of :class:`~optuna.FrozenTrial` objects.
         """
 
-        self._storage.read_trials_from_remote_storage(self._study_id)
-        return self._storage.get_all_trials(self._study_id, deepcopy=deepcopy)
+        self._maybe_sync()
+        if self._storage_is_in_memory:
+            return self._storage.get_all_trials(self._study_id, deepcopy=deepcopy)
+
+        # Only the trials beyond the cached finished prefix are fetched from the
+        # remote storage, in one batched call.
+        cached = self._finished_trials_cache
+        fetched = self._storage.prefetch_trials(self._study_id, len(cached) - 1)
+        trials = cached + fetched
+
+        # Extend the cached prefix as long as it stays consecutive and finished.
+        for trial in fetched:
+            if trial.number != len(cached) or not trial.state.is_finished():
+                break
+            cached.append(trial)
+
+        return copy.deepcopy(trials) if deepcopy else trials
+
+    def get_trials_readonly(self) -> List[FrozenTrial]:
+        """Return all trials in the study without copying.
+
+        This is a short form of ``self.get_trials(deepcopy=False)``. The returned trials
+        are views over the storage's internal state and must not be mutated.
+
+        Returns:
+            A list of :class:`~optuna.FrozenTrial` objects.
+        """
+
+        return self.get_trials(deepcopy=False)
 
     @property
     def user_attrs(self) -> Dict[str, Any]:
@@ -205,7 +447,7 @@ class Study(object):
             A dictionary containing all user attributes.
         """
 
-        return copy.deepcopy(self._storage.get_study_user_attrs(self._study_id))
+        return dict(self._get_snapshot().user_attrs)
 
     @property
     def system_attrs(self) -> Dict[str, Any]:
@@ -215,7 +457,7 @@ class Study(object):
             A dictionary containing all system attributes.
         """
 
-        return copy.deepcopy(self._storage.get_study_system_attrs(self._study_id))
+        return dict(self._get_snapshot().system_attrs)
 
     def set_user_attr(self, key: str, value: Any) -> None:
         """Set a user attribute to the study.
@@ -256,6 +498,7 @@ class Study(object):
         """
 
         self._storage.set_study_user_attr(self._study_id, key, value)
+        self._snapshot_cache = None
 
     def set_system_attr(self, key: str, value: Any) -> None:
         """Set a system attribute to the study.
@@ -270,6 +513,7 @@ class Study(object):
         """
 
         self._storage.set_study_system_attr(self._study_id, key, value)
+        self._snapshot_cache = None
 
     def stop(self) -> None:
 
@@ -303,8 +547,7 @@ class Study(object):
                 If this method is called outside an objective function or callback.
         """
 
-        if self._optimize_lock.acquire(False):
-            self._optimize_lock.release()
+        if not self._inside_optimize:
             raise RuntimeError(
                 "`Study.stop` is supposed to be invoked inside an objective function or a "
                 "callback."
@@ -411,6 +654,7 @@ class Study(object):
         trial._validate()
 
         self._storage.create_new_trial(self._study_id, template_trial=trial)
+        self._snapshot_cache = None
 
 
 def create_study(
@@ -494,8 +738,9 @@ def create_study(
         else:
             raise
 
-    study_name = storage.get_study_name_from_id(study_id)
-    study = Study(study_name=study_name, storage=storage, sampler=sampler, pruner=pruner)
+    if study_name is None:
+        study_name = storage.get_study_name_from_id(study_id)
+    study = Study._from_id(storage, study_id, study_name, sampler=sampler, pruner=pruner)
 
     if direction == "minimize":
         _direction = StudyDirection.MINIMIZE
@@ -566,7 +811,9 @@ def load_study(
 
     """
 
-    return Study(study_name=study_name, storage=storage, sampler=sampler, pruner=pruner)
+    storage = storages.get_storage(storage)
+    study_id = storage.get_study_id_from_name(study_name)
+    return Study._from_id(storage, study_id, study_name, sampler=sampler, pruner=pruner)
 
 
 def delete_study(
@@ -1,3 +1,4 @@
+import dataclasses
 import datetime
 from typing import Any
 from typing import Dict
@@ -7,7 +8,8 @@ import optuna_core
 from optuna_core import trial
 
 
-class StudySummary(object):
+@dataclasses.dataclass(frozen=True, slots=True)
+class StudySummary:
     """Basic attributes and aggregated results of a :class:`~optuna.study.Study`.
 
     See also :func:`optuna.study.get_all_study_summaries`.
@@ -32,33 +34,17 @@ class StudySummary(object):
 
     """
 
-    def __init__(
-        self,
-        study_name: str,
-        direction: "optuna_core.study.StudyDirection",
-        best_trial: Optional[trial.FrozenTrial],
-        user_attrs: Dict[str, Any],
-        system_attrs: Dict[str, Any],
-        n_trials: int,
-        datetime_start: Optional[datetime.datetime],
-        study_id: int,
-    ):
-
-        self.study_name = study_name
-        self.direction = direction
-        self.best_trial = best_trial
-        self.user_attrs = user_attrs
-        self.system_attrs = system_attrs
-        self.n_trials = n_trials
-        self.datetime_start = datetime_start
-        self._study_id = study_id
-
-    def __eq__(self, other: Any) -> bool:
-
-        if not isinstance(other, StudySummary):
-            return NotImplemented
-
-        return other.__dict__ == self.__dict__
+    study_name: str
+    direction: "optuna_core.study.StudyDirection"
+    best_trial: Optional[trial.FrozenTrial]
+    user_attrs: Dict[str, Any]
+    system_attrs: Dict[str, Any]
+    n_trials: int
+    datetime_start: Optional[datetime.datetime]
+    _study_id: int
+
+    # Summaries are ordered by study ID only, so `order=True` over all fields would be
+    # both wrong and slower. `__eq__` is generated by the dataclass machinery.
 
     def __lt__(self, other: Any) -> bool:
 
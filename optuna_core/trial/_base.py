@@ -15,6 +15,9 @@ class BaseTrial(object, metaclass=abc.ABCMeta):
     Note that this class is not supposed to be directly accessed by library users.
     """
 
+    # Empty slots so that slotted subclasses are not forced to carry a `__dict__`.
+    __slots__ = ()
+
     @abc.abstractmethod
     def suggest_float(
         self,
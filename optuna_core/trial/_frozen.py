@@ -113,6 +113,23 @@ class FrozenTrial(BaseTrial):
             Intermediate objective values set with :func:`optuna.trial.Trial.report`.
     """
 
+    # Fixing the attribute layout removes the per-instance `__dict__`. Trials are the
+    # most numerous objects in a study, so this shrinks memory and speeds up the field
+    # accesses storages and pruners do in bulk.
+    __slots__ = (
+        "_number",
+        "state",
+        "value",
+        "_datetime_start",
+        "datetime_complete",
+        "_params",
+        "_user_attrs",
+        "_system_attrs",
+        "intermediate_values",
+        "_distributions",
+        "_trial_id",
+    )
+
     def __init__(
         self,
         number: int,
@@ -160,7 +177,9 @@ class FrozenTrial(BaseTrial):
 
         if not isinstance(other, FrozenTrial):
             return NotImplemented
-        return other.__dict__ == self.__dict__
+        return all(
+            getattr(self, field) == getattr(other, field) for field in self._ordered_fields
+        )
 
     def __lt__(self, other: Any) -> bool:
 
@@ -329,6 +348,28 @@ class FrozenTrial(BaseTrial):
                     "{}.".format(param_value, param_name, distribution)
                 )
 
+    def _fast_clone(self) -> "FrozenTrial":
+        """Return a copy of the trial that is safe to hand to library users.
+
+        Unlike ``copy.deepcopy``, only the containers are copied. Distributions are
+        immutable value objects and the remaining fields are immutable scalars, so
+        shallow dict copies suffice while avoiding the reflective deepcopy machinery.
+        """
+
+        return FrozenTrial(
+            number=self._number,
+            state=self.state,
+            value=self.value,
+            datetime_start=self._datetime_start,
+            datetime_complete=self.datetime_complete,
+            params=dict(self._params),
+            distributions=dict(self._distributions),
+            user_attrs=dict(self._user_attrs),
+            system_attrs=dict(self._system_attrs),
+            intermediate_values=dict(self.intermediate_values),
+            trial_id=self._trial_id,
+        )
+
     def _suggest(self, name: str, distribution: BaseDistribution) -> Any:
 
         if name not in self._params:
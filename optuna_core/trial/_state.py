@@ -1,9 +1,12 @@
 import enum
 
 
-class TrialState(enum.Enum):
+class TrialState(enum.IntEnum):
     """State of a :class:`~optuna.trial.Trial`.
 
+    The states are backed by plain ints so that comparisons on hot paths compile down
+    to C-level int equality instead of enum ``__eq__`` dispatch.
+
     Attributes:
         RUNNING:
             The :class:`~optuna.trial.Trial` is running.
@@ -24,8 +27,16 @@ class TrialState(enum.Enum):
 
     def __repr__(self) -> str:
 
-        return str(self)
+        return "TrialState.{}".format(self.name)
+
+    __str__ = __repr__
 
     def is_finished(self) -> bool:
 
-        return self != TrialState.RUNNING and self != TrialState.WAITING
+        return self != _RUNNING and self != _WAITING
+
+
+# Pre-resolved int values; comparing a member against these skips the `.value`
+# descriptor lookup on every call.
+_RUNNING = TrialState.RUNNING.value
+_WAITING = TrialState.WAITING.value
@@ -1,5 +1,6 @@
 import copy
 import datetime
+import sys
 from typing import Any
 from typing import Dict
 from typing import Optional
@@ -41,6 +42,15 @@ class Trial(BaseTrial):
 
     def __init__(self, study: "optuna_core.study.Study", trial_id: int) -> None:
 
+        self._reset(study, trial_id)
+
+    def _reset(self, study: "optuna_core.study.Study", trial_id: int) -> None:
+        """(Re-)initialize the trial in place.
+
+        Lets :func:`~optuna.study.Study.ask` recycle pooled ``Trial`` objects without
+        allocating a new one; all per-trial state is overwritten here.
+        """
+
         self.study = study
         self._trial_id = trial_id
 
@@ -54,7 +64,7 @@ class Trial(BaseTrial):
 
         trial = self.storage.get_trial(self._trial_id)
 
-        study = optuna_core.pruners._filter_study(self.study, trial)
+        study = self.study._pruner_filter(trial)
 
         self.relative_search_space = self.study.sampler.infer_relative_search_space(study, trial)
         self.relative_params = self.study.sampler.sample_relative(
@@ -666,6 +676,11 @@ class Trial(BaseTrial):
 
     def _suggest(self, name: str, distribution: BaseDistribution) -> Any:
 
+        # Parameter names are used as dict keys throughout the trial and study
+        # bookkeeping. Interning them makes those lookups hit the pointer-equality
+        # fast path instead of comparing string contents.
+        name = sys.intern(name)
+
         storage = self.storage
         trial_id = self._trial_id
 
@@ -683,10 +698,14 @@ class Trial(BaseTrial):
             elif self._is_relative_param(name, distribution):
                 param_value = self.relative_params[name]
             else:
-                study = optuna_core.pruners._filter_study(self.study, trial)
-                param_value = self.study.sampler.sample_independent(
-                    study, trial, name, distribution
-                )
+                suggestor = self.study._compiled_suggestor(name, distribution)
+                if suggestor is not None:
+                    param_value = suggestor()
+                else:
+                    study = self.study._pruner_filter(trial)
+                    param_value = self.study.sampler.sample_independent(
+                        study, trial, name, distribution
+                    )
 
             param_value_in_internal_repr = distribution.to_internal_repr(param_value)
             storage.set_trial_param(trial_id, name, param_value_in_internal_repr, distribution)